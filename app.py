@@ -1,12 +1,19 @@
-import json
+import asyncio
+import datetime
+import logging
 import time
+from functools import lru_cache
 from pathlib import Path
 
 import gradio as gr
 import openai
+import orjson
+from cachetools import TTLCache
 
-from prompts import SYSTEM_PROMPT
-from tools import *
+from prompts import CONVERSATION_SUMMARY_PROMPT, PERSONA_REMINDER, SYSTEM_PROMPT
+from tools import TOOL_REGISTRY, VIDEO_GAME_TOOLS
+
+logger = logging.getLogger(__name__)
 
 BASE_DIR = Path(__file__).parent
 ASSETS_DIR = BASE_DIR / "assets"
@@ -34,6 +41,28 @@ epic 😎 or cringe 🤮
 
 WELCOME_DELAY_SECONDS = 1
 
+
+# Synthetic opener: the welcome message is revealed on page load and synced
+# into the chat history, so it already arrives via `history` as the first
+# assistant turn. We only prepend the matching "hi" so that assistant greeting
+# has a user antecedent and the conversation is well-formed for the LLM.
+OPENER_MESSAGE = {"role": "user", "content": "hi"}
+
+# Async client so chat() can await the model without blocking Gradio's event loop.
+OPENAI_CLIENT = openai.AsyncOpenAI()
+
+CHAT_MODEL = "gpt-5.4-nano"
+
+# History messages are sent verbatim in a sliding window; older messages are folded into a
+# running summary in blocks of this size, so the summary only changes every few turns.
+HISTORY_WINDOW_SIZE = 8
+
+# Running conversation summaries per Gradio session: (summarized message count, fingerprint, summary).
+CONVERSATION_SUMMARIES: TTLCache = TTLCache(maxsize=1024, ttl=6 * 60 * 60)
+
+# Background summary refreshes per Gradio session, held here so each task stays referenced until done.
+SUMMARY_TASKS = {}
+
 LOADING_BUBBLE_HTML = """
 <div class="nerdbot-loading-bubble" role="status" aria-label="Loading response">
     <span></span>
@@ -43,59 +72,176 @@ LOADING_BUBBLE_HTML = """
 """
 
 
-def handle_tool_calls(tool_calls):
+async def call_tool(tool_call):
+    """Invoke the tool named by a single tool call with its JSON-encoded arguments."""
+    tool_name = tool_call["function"]["name"]
+    arguments = orjson.loads(tool_call["function"]["arguments"] or "{}")
+    print(f"Tool called: {tool_name}", flush=True)
+    print(f"Arguments: {arguments}", flush=True)
+    tool = TOOL_REGISTRY.get(tool_name)
+    return await tool(**arguments) if tool else {}
+
+
+def merge_tool_call_delta(tool_calls, delta):
+    """Fold one streamed tool call fragment into the tool calls assembled so far."""
+    # Fragments share an index; the id and name arrive once, the arguments piecewise.
+    tool_call = tool_calls.setdefault(
+        delta.index, {"id": "", "type": "function", "function": {"name": "", "arguments": ""}}
+    )
+    if delta.id:
+        tool_call["id"] = delta.id
+    if delta.function:
+        tool_call["function"]["name"] += delta.function.name or ""
+        tool_call["function"]["arguments"] += delta.function.arguments or ""
+
+
+async def handle_tool_calls(tool_calls):
+    """Run every requested tool concurrently, returning the results in tool call order."""
+    # gather() preserves input order, so each result lines up with its tool_call_id.
+    outcomes = await asyncio.gather(*(call_tool(tool_call) for tool_call in tool_calls), return_exceptions=True)
     results = []
-    for tool_call in tool_calls:
-        tool_name = tool_call.function.name
-        arguments = json.loads(tool_call.function.arguments)
-        print(f"Tool called: {tool_name}", flush=True)
-        print(f"Arguments: {arguments}", flush=True)
-        tool = globals().get(tool_name)
-        result = tool(**arguments) if tool else {}
-        results.append({"role": "tool","content": json.dumps(result),"tool_call_id": tool_call.id})
+    for tool_call, outcome in zip(tool_calls, outcomes):
+        if isinstance(outcome, BaseException):
+            outcome = {"success": False, "failure_reason": f"Tool error: {outcome}"}
+        results.append({"role": "tool","content": orjson.dumps(outcome).decode(),"tool_call_id": tool_call["id"]})
     return results
 
-def chat(message, history):
-    """Conduct a chat exchange with the model, forwarding prior history and the newest user prompt."""
-    persona_reminder = (
-        "REMINDER: Maintain your persona. Let your gaming knowledge gush out with references, Easter eggs, deep-cut trivia, and self-aware nerd humor. Use ample asterisk actions."
-    )
-    messages = (
-        [{"role": "system", "content": SYSTEM_PROMPT}]
-        # Synthetic opener: the welcome message is revealed on page load and synced
-        # into the chat history, so it already arrives via `history` as the first
-        # assistant turn. We only prepend the matching "hi" so that assistant greeting
-        # has a user antecedent and the conversation is well-formed for the LLM.
-        + [{"role": "user", "content": "hi"}]
-        + history
-        + [
-            {
-                "role": "user",
-                "content": f"{message}\n\n{persona_reminder}",
-            }
-        ]
+
+@lru_cache(maxsize=1)
+def system_message_for(today):
+    """Build the system message for a given ISO date, reusing it for the rest of that day."""
+    # Every request that day starts with a byte-identical prefix the provider can prompt-cache.
+    # The persona reminder lives here rather than in each user turn to keep that prefix stable,
+    # and the date comes last so relative-date questions need no extra tool round-trip.
+    return {
+        "role": "system",
+        "content": f"{SYSTEM_PROMPT}\n\n{PERSONA_REMINDER}\n\nToday's date is {today}.",
+    }
+
+
+def fingerprint_messages(messages):
+    """Hash the roles and contents of chat messages to detect when a summarized prefix changes."""
+    return hash(tuple((entry["role"], str(entry["content"])) for entry in messages))
+
+
+def format_transcript(messages):
+    """Render chat messages as a plain-text transcript for summarization."""
+    return "\n\n".join(f"{entry['role'].capitalize()}: {entry['content']}" for entry in messages)
+
+
+def cached_summary(session_id, history):
+    """Return (summarized message count, summary) if the session's cached summary still matches history."""
+    summarized_count, fingerprint, summary = CONVERSATION_SUMMARIES.get(session_id, (0, None, ""))
+
+    # Ignore the cached summary if it no longer describes this conversation (e.g. after a clear).
+    if summarized_count > len(history) or fingerprint != fingerprint_messages(history[:summarized_count]):
+        return 0, ""
+    return summarized_count, summary
+
+
+async def summarize_history(session_id, history, cutoff):
+    """Fold history[:cutoff] into this session's cached summary, extending the previous one when possible."""
+    summarized_count, summary = cached_summary(session_id, history)
+    if summarized_count > cutoff:
+        summarized_count, summary = 0, ""
+
+    if summarized_count == cutoff:
+        return
+
+    transcript = format_transcript(history[summarized_count:cutoff])
+    if summary:
+        transcript = f"Earlier summary:\n{summary}\n\nNewer messages:\n{transcript}"
+    response = await OPENAI_CLIENT.chat.completions.create(
+        model=CHAT_MODEL,
+        messages=[
+            {"role": "system", "content": CONVERSATION_SUMMARY_PROMPT},
+            {"role": "user", "content": transcript},
+        ],
     )
-    done = False
-    while not done:
-
-        # This is the call to the LLM - see that we pass in the tools json
-
-        response = openai.chat.completions.create(model="gpt-5.4-nano", messages=messages, tools=VIDEO_GAME_TOOLS)
-
-        finish_reason = response.choices[0].finish_reason
-        
-        # If the LLM wants to call a tool, we do that!
-         
-        if finish_reason=="tool_calls":
-            message = response.choices[0].message
-            tool_calls = message.tool_calls
-            results = handle_tool_calls(tool_calls)
-            messages.append(message)
-            messages.extend(results)
-        else:
-            done = True
-
-    return response.choices[0].message.content
+    summary = response.choices[0].message.content or ""
+    CONVERSATION_SUMMARIES[session_id] = (cutoff, fingerprint_messages(history[:cutoff]), summary)
+
+
+async def refresh_summary(session_id, history, cutoff):
+    """Run summarize_history in the background, logging failures instead of raising them."""
+    try:
+        await summarize_history(session_id, history, cutoff)
+    except openai.OpenAIError as error:
+        # Later turns keep using the previous summary, or the full history, until a refresh succeeds.
+        logger.warning("Conversation summary failed: %s", error)
+
+
+def schedule_summary(session_id, history):
+    """Start a background summary refresh once another block of history has left the recent window."""
+    # Keep between HISTORY_WINDOW_SIZE and twice that many recent messages verbatim.
+    cutoff = max(0, (len(history) // HISTORY_WINDOW_SIZE - 1) * HISTORY_WINDOW_SIZE)
+    if not cutoff or session_id in SUMMARY_TASKS or cached_summary(session_id, history)[0] == cutoff:
+        return
+
+    task = asyncio.create_task(refresh_summary(session_id, history, cutoff))
+    SUMMARY_TASKS[session_id] = task
+    task.add_done_callback(lambda _: SUMMARY_TASKS.pop(session_id, None))
+
+
+def build_messages(message, history, session_id):
+    """Assemble the model input: system prompt, summary of older turns, recent messages and new message."""
+    system_message = system_message_for(datetime.date.today().isoformat())
+    user_message = {"role": "user", "content": message}
+
+    # Only an already-finished summary is used; refreshes run after the reply, off the critical path.
+    summarized_count, summary = cached_summary(session_id, history)
+    if summarized_count:
+        summary_message = {"role": "system", "content": f"Conversation summary: {summary}"}
+        return [system_message, summary_message, *history[summarized_count:], user_message]
+
+    return [system_message, OPENER_MESSAGE, *history, user_message]
+
+
+async def chat(message, history, request: gr.Request):
+    """Conduct a chat exchange with the model, streaming the growing reply as it is generated."""
+    session_id = getattr(request, "session_hash", None)
+    messages = build_messages(message, history, session_id)
+    # Text streamed in earlier rounds stays on screen ahead of each follow-up round after a tool call.
+    earlier_text = ""
+    displayed = ""
+    while True:
+
+        # This is the call to the LLM - see that we pass in the tools json.
+        # Streaming lets the reply render as soon as the first tokens arrive.
+
+        stream = await OPENAI_CLIENT.chat.completions.create(
+            model=CHAT_MODEL, messages=messages, tools=VIDEO_GAME_TOOLS, stream=True
+        )
+
+        content = ""
+        tool_calls = {}
+        finish_reason = None
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            if choice.delta.content:
+                content += choice.delta.content
+                displayed = earlier_text + content
+                yield displayed
+            for tool_call_delta in choice.delta.tool_calls or []:
+                merge_tool_call_delta(tool_calls, tool_call_delta)
+            finish_reason = choice.finish_reason or finish_reason
+
+        # If the LLM wants to call a tool, we do that and stream the follow-up answer!
+
+        if finish_reason != "tool_calls":
+            # Fold older turns, including this one, into the summary without delaying this reply.
+            completed_turn = [{"role": "user", "content": message}, {"role": "assistant", "content": displayed}]
+            schedule_summary(session_id, [*history, *completed_turn])
+            return
+
+        assembled_tool_calls = [tool_calls[index] for index in sorted(tool_calls)]
+        results = await handle_tool_calls(assembled_tool_calls)
+        messages.append({"role": "assistant", "content": content or None, "tool_calls": assembled_tool_calls})
+        messages.extend(results)
+        if content:
+            earlier_text = f"{displayed}\n\n"
 
 
 def welcome_messages():
@@ -1,17 +1,18 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
-class GameDescriptionResponse(BaseModel):
+@dataclass(slots=True)
+class GameDescriptionResponse:
     name: str
     game_id: int # RAWG internal ID
     description: str
     def __str__(self) -> str:
         """Render the game description in a readable format."""
 
-        return (
-            f"Name: {self.name}\n"
-            f"ID: {self.game_id}\n"
-            f"Description: \"{self.description}\""
-        )
+        return "\n".join((
+            f"Name: {self.name}",
+            f"ID: {self.game_id}",
+            f"Description: \"{self.description}\"",
+        ))
 
     @classmethod
     def create_description_response_from_json(
@@ -27,7 +28,8 @@ class GameDescriptionResponse(BaseModel):
 
 
 
-class GameDetailsResponse(BaseModel):
+@dataclass(slots=True)
+class GameDetailsResponse:
     name: str
     game_id: int # RAWG internal ID
     average_playtime: int # how long to beat on average (hours)
@@ -41,27 +43,19 @@ class GameDetailsResponse(BaseModel):
     def __str__(self) -> str:
         """Render the game details in a human-readable format."""
 
-        # Format platforms, stores, and genres as comma-separated strings for readability.
-        formatted_platforms = ", ".join(self.platforms) if self.platforms else "N/A"
-        formatted_stores = ", ".join(self.stores) if self.stores else "N/A"
-        formatted_genres = ", ".join(self.genres) if self.genres else "N/A"
-
-        # Provide sensible fallbacks for optional fields.
-        formatted_metacritic = str(self.metacritic_score) if self.metacritic_score is not None else "N/A"
-        formatted_esrb = self.esrb_rating if self.esrb_rating else "N/A"
-
-        # Assemble the multi-line string representation with explicit labels.
-        return (
-            f"Name: {self.name}\n"
-            f"ID: {self.game_id}\n"
-            f"Average Playtime (hours): {self.average_playtime}\n"
-            f"Platforms: {formatted_platforms}\n"
-            f"Stores: {formatted_stores}\n"
-            f"Genres: {formatted_genres}\n"
-            f"Release Date: {self.released or 'N/A'}\n"
-            f"Metacritic Rating: {formatted_metacritic}/100\n"
-            f"Maturity Rating: {formatted_esrb}"
-        )
+        # Assemble the labelled lines in one join, formatting lists as comma-separated strings
+        # and falling back to "N/A" for empty or missing values.
+        return "\n".join((
+            f"Name: {self.name}",
+            f"ID: {self.game_id}",
+            f"Average Playtime (hours): {self.average_playtime}",
+            f"Platforms: {', '.join(self.platforms) or 'N/A'}",
+            f"Stores: {', '.join(self.stores) or 'N/A'}",
+            f"Genres: {', '.join(self.genres) or 'N/A'}",
+            f"Release Date: {self.released or 'N/A'}",
+            f"Metacritic Rating: {'N/A' if self.metacritic_score is None else self.metacritic_score}/100",
+            f"Maturity Rating: {self.esrb_rating or 'N/A'}",
+        ))
 
     @classmethod
     def create_game_objects_from_search_results(
@@ -69,59 +63,65 @@ class GameDetailsResponse(BaseModel):
     ) -> list["GameDetailsResponse"]:
         """Convert RAWG search result dictionaries into simplified game objects."""
 
+        return [
+            cls(**serialized_game)
+            for serialized_game in cls.create_serialized_games_from_search_results(search_results)
+        ]
+
+    @classmethod
+    def create_serialized_games_from_search_results(
+        cls, search_results: list[dict]
+    ) -> list[dict]:
+        """Convert RAWG search results straight into plain dictionaries shaped like this model."""
+
         # Handle missing or empty search results gracefully.
         if not search_results:
             return []
 
-        # Prepare a container to hold the parsed GameDetailsResponse instances.
-        parsed_games: list[GameDetailsResponse] = []
+        # Prepare a container to hold the serialized game dictionaries.
+        serialized_games: list[dict] = []
 
         for result in search_results:
             # Extract platform names from nested platform dictionaries.
-            platform_entries = result.get("platforms") or []
             platform_names = [
-                platform_entry.get("platform", {}).get("name")
-                for platform_entry in platform_entries
-                if platform_entry.get("platform", {}).get("name")
+                name
+                for platform_entry in result.get("platforms") or []
+                if (name := (platform_entry.get("platform") or {}).get("name"))
             ]
 
             # Extract store names from nested store dictionaries.
-            store_entries = result.get("stores") or []
             store_names = [
-                store_entry.get("store", {}).get("name")
-                for store_entry in store_entries
-                if store_entry.get("store", {}).get("name")
+                name
+                for store_entry in result.get("stores") or []
+                if (name := (store_entry.get("store") or {}).get("name"))
             ]
 
             # Extract genre names from the genre dictionaries.
-            genre_entries = result.get("genres") or []
             genre_names = [
-                genre_entry.get("name")
-                for genre_entry in genre_entries
-                if genre_entry.get("name")
+                name
+                for genre_entry in result.get("genres") or []
+                if (name := genre_entry.get("name"))
             ]
 
             # Pull the localized ESRB rating when available.
-            esrb_rating_name = None
             esrb_rating_data = result.get("esrb_rating")
-            if isinstance(esrb_rating_data, dict):
-                esrb_rating_name = esrb_rating_data.get("name_en")
-
-            # Populate the response object with normalized values and sensible defaults.
-            game_details = cls(
-                name=result.get("name") or "",
-                game_id=result.get("id") or 0,
-                average_playtime=int(result.get("playtime") or 0),
-                platforms=platform_names,
-                stores=store_names,
-                genres=genre_names,
-                released=result.get("released") or "",
-                metacritic_score=result.get("metacritic"),
-                esrb_rating=esrb_rating_name,
+            esrb_rating_name = esrb_rating_data.get("name_en") if isinstance(esrb_rating_data, dict) else None
+
+            # Populate the dictionary with normalized values and sensible defaults; the result
+            # is only serialized to JSON for the LLM, so no object is built.
+            serialized_games.append(
+                {
+                    "name": result.get("name") or "",
+                    "game_id": result.get("id") or 0,
+                    "average_playtime": int(result.get("playtime") or 0),
+                    "platforms": platform_names,
+                    "stores": store_names,
+                    "genres": genre_names,
+                    "released": result.get("released") or "",
+                    "metacritic_score": result.get("metacritic"),
+                    "esrb_rating": esrb_rating_name,
+                }
             )
 
-            # Accumulate the parsed game details for the final response.
-            parsed_games.append(game_details)
-
-        # Return the fully constructed list of game detail objects to the caller.
-        return parsed_games
\ No newline at end of file
+        # Return the fully serialized list of games to the caller.
+        return serialized_games
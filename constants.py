@@ -1,5 +1,9 @@
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+
 # Mapping of RAWG platform slugs to their documented numeric identifiers.
-PLATFORM_SLUG_TO_ID: dict[str, int] = {
+_PLATFORM_SLUG_TO_ID: dict[str, int] = {
     "xbox-one": 1,
     "ios": 3,
     "pc": 4,
@@ -53,7 +57,7 @@ PLATFORM_SLUG_TO_ID: dict[str, int] = {
     "playstation5": 187,
 }
 
-PARENT_PLATFORM_SLUG_TO_ID: dict[str, int] = {
+_PARENT_PLATFORM_SLUG_TO_ID: dict[str, int] = {
     "pc": 1,
     "playstation": 2,
     "xbox": 3,
@@ -70,7 +74,7 @@ PARENT_PLATFORM_SLUG_TO_ID: dict[str, int] = {
     "web": 14,
 }
 
-STORE_SLUG_TO_ID: dict[str, int] = {
+_STORE_SLUG_TO_ID: dict[str, int] = {
     "steam": 1,
     "xbox-store": 2,
     "playstation-store": 3,
@@ -83,7 +87,24 @@ STORE_SLUG_TO_ID: dict[str, int] = {
     "epic-games": 11,
 }
 
-DEVELOPER_SLUGS: list[str] = [
+# Intern the slug keys once at import, and expose the fixed lookups read-only so no caller can
+# add or remap IDs at runtime.
+PLATFORM_SLUG_TO_ID: Mapping[str, int] = MappingProxyType(
+    {sys.intern(slug): slug_id for slug, slug_id in _PLATFORM_SLUG_TO_ID.items()}
+)
+PARENT_PLATFORM_SLUG_TO_ID: Mapping[str, int] = MappingProxyType(
+    {sys.intern(slug): slug_id for slug, slug_id in _PARENT_PLATFORM_SLUG_TO_ID.items()}
+)
+STORE_SLUG_TO_ID: Mapping[str, int] = MappingProxyType(
+    {sys.intern(slug): slug_id for slug, slug_id in _STORE_SLUG_TO_ID.items()}
+)
+
+# Sorted slug vocabularies for the tool schema enums, computed once per process.
+PLATFORM_SLUGS_SORTED: tuple[str, ...] = tuple(sorted(PLATFORM_SLUG_TO_ID))
+PARENT_PLATFORM_SLUGS_SORTED: tuple[str, ...] = tuple(sorted(PARENT_PLATFORM_SLUG_TO_ID))
+STORE_SLUGS_SORTED: tuple[str, ...] = tuple(sorted(STORE_SLUG_TO_ID))
+
+DEVELOPER_SLUGS: tuple[str, ...] = tuple(map(sys.intern, [
     "valve-software",
     "ubisoft",
     "feral-interactive",
@@ -154,9 +175,9 @@ DEVELOPER_SLUGS: list[str] = [
     "infinity-ward",
     "2k-marin",
     "irrational-games",
-]
+]))
 
-PUBLISHER_SLUGS: list[str] = [
+PUBLISHER_SLUGS: tuple[str, ...] = tuple(map(sys.intern, [
     "electronic-arts",
     "square-enix",
     "ubisoft-entertainment",
@@ -197,9 +218,9 @@ PUBLISHER_SLUGS: list[str] = [
     "cd-projekt-red",
     "eidos-interactive",
     "kiss-ltd",
-]
+]))
 
-GENRE_SLUGS: list[str] = [
+GENRE_SLUGS: tuple[str, ...] = tuple(map(sys.intern, [
     "action",
     "indie",
     "adventure",
@@ -219,9 +240,9 @@ GENRE_SLUGS: list[str] = [
     "board-games",
     "card",
     "educational",
-]
+]))
 
-TAG_SLUGS: list[str] = [
+TAG_SLUGS: tuple[str, ...] = tuple(map(sys.intern, [
     "singleplayer",
     "steam-achievements",
     "multiplayer",
@@ -291,9 +312,9 @@ TAG_SLUGS: list[str] = [
     "turn-based",
     "post-apocalyptic",
     "cute",
-]
+]))
 
-ORDERINGS = [
+ORDERINGS: tuple[str, ...] = (
     "name",
     "released",
     "added",
@@ -308,4 +329,17 @@ ORDERINGS = [
     "-updated",
     "-rating",
     "-metacritic",
-]
\ No newline at end of file
+)
+
+# Every enum advertised in the tool schema, keyed by parameter name. Read-only and backed by
+# tuples, so nothing can mutate a vocabulary after the schema has captured it.
+SCHEMA_ENUM_POOL: MappingProxyType[str, tuple[str, ...]] = MappingProxyType({
+    "parent_platforms": PARENT_PLATFORM_SLUGS_SORTED,
+    "platforms": PLATFORM_SLUGS_SORTED,
+    "stores": STORE_SLUGS_SORTED,
+    "developers": DEVELOPER_SLUGS,
+    "publishers": PUBLISHER_SLUGS,
+    "genres": GENRE_SLUGS,
+    "tags": TAG_SLUGS,
+    "ordering": ORDERINGS,
+})
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+from cachetools import TTLCache
+from collections.abc import Callable
+from constants import PLATFORM_SLUG_TO_ID
 from dotenv import load_dotenv
+import httpx
+import logging
+import orjson
 import os
 import random
-import requests
-import time
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Self
+
+logger = logging.getLogger(__name__)
 
 
 class Database:
@@ -19,6 +27,45 @@ class Database:
 
     RAWG_GAMES_API_BASE_URL = "https://api.rawg.io/api/games"
 
+    # Bounds for the in-process cache of successful RAWG responses.
+    RESPONSE_CACHE_MAX_SIZE = 1024
+    RESPONSE_CACHE_TTL_SECONDS = 3600
+
+    # Upper bound, in seconds, for a single retry backoff.
+    MAX_RETRY_DELAY_SECONDS = 30.0
+
+    # Filter values that leave a multi-game search unbounded on release date or metacritic score.
+    DEFAULT_RELEASE_DATE_LOWER_BOUND = "1800-01-01"
+    DEFAULT_RELEASE_DATE_UPPER_BOUND = "3000-01-01"
+    DEFAULT_METACRITIC_LOWER_BOUND = 0
+    DEFAULT_METACRITIC_UPPER_BOUND = 100
+
+    # The most common multi-game search shape is a single platform plus a sort order with no other
+    # filters; these combinations get complete request URLs built once at startup.
+    PREBUILT_PLATFORM_SLUGS = (
+        "pc",
+        "playstation5",
+        "playstation4",
+        "xbox-series-x",
+        "xbox-one",
+        "nintendo-switch",
+    )
+    PREBUILT_ORDERINGS = (None, "-metacritic", "-rating", "-released", "-added")
+    PREBUILT_PAGE_SIZE = 5
+
+    # The fields of each multi-game search result that the tools read; the rest are dropped while parsing.
+    SEARCH_RESULT_FIELDS = (
+        "id",
+        "name",
+        "playtime",
+        "platforms",
+        "stores",
+        "genres",
+        "released",
+        "metacritic",
+        "esrb_rating",
+    )
+
     # ====================
     #    Initialization
     # ====================
@@ -32,56 +79,237 @@ class Database:
         # Store configuration details for downstream API calls.
         self.rawg_api_key = os.getenv("RAWG_API_KEY")
 
-        # Maintain a shared HTTP session to reuse TCP connections for outbound calls.
-        self.http_session = requests.Session()
+        # Query parameters shared by every RAWG request, resolved once and merged into each call.
+        self._base_params = MappingProxyType({
+            "key": self.rawg_api_key,
+            "exclude_additions": True,
+        })
+
+        # Complete URLs for the most common search shapes, keyed by (platform ID, ordering).
+        self._prebuilt_search_urls = self._build_prebuilt_search_urls()
+
+        # The shared HTTP client is created lazily so its connections belong to the running event loop.
+        self._client: httpx.AsyncClient | None = None
+
+        # Cache successful responses so revisited games and repeated searches skip the network.
+        self._cache: TTLCache = TTLCache(
+            maxsize=self.RESPONSE_CACHE_MAX_SIZE, ttl=self.RESPONSE_CACHE_TTL_SECONDS
+        )
+
+        # Requests currently on the wire, keyed like the cache, so duplicates can await them.
+        self._inflight: dict[tuple, asyncio.Future] = {}
+
+    async def __aenter__(self) -> Self:
+        """Open the shared HTTP client when used as an async context manager."""
+
+        self._get_client()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the shared HTTP client on context exit."""
+
+        await self.close()
+
+    async def close(self) -> None:
+        """Release the pooled connections held by the shared HTTP client."""
+
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    def cache_clear(self) -> None:
+        """Drop every cached RAWG response."""
+
+        self._cache.clear()
 
     # ====================
     #     Helper Methods
     # ====================
 
-    def _make_request_with_retry(
-        self, url: str, params: dict[str, Any], max_retries: int = 3, base_delay: float = 1.0
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating its connection pool on first use."""
+
+        if self._client is None or self._client.is_closed:
+            # HTTP/2 multiplexes concurrent tool calls over one TLS connection to RAWG.
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+                timeout=httpx.Timeout(10.0, connect=3.0),
+            )
+        return self._client
+
+    def _build_prebuilt_search_urls(self) -> dict[tuple[int, str | None], str]:
+        """Encode the full search URL for each prebuilt platform and ordering combination."""
+
+        prebuilt_urls: dict[tuple[int, str | None], str] = {}
+        for platform_slug in self.PREBUILT_PLATFORM_SLUGS:
+            platform_id = PLATFORM_SLUG_TO_ID[platform_slug]
+            for ordering in self.PREBUILT_ORDERINGS:
+                # Mirror the parameters find_multiple_games_by_conditions sends for this shape.
+                search_params = self._base_params | {
+                    "page_size": self.PREBUILT_PAGE_SIZE,
+                    "dates": f"{self.DEFAULT_RELEASE_DATE_LOWER_BOUND},{self.DEFAULT_RELEASE_DATE_UPPER_BOUND}",
+                    "metacritic": f"{self.DEFAULT_METACRITIC_LOWER_BOUND},{self.DEFAULT_METACRITIC_UPPER_BOUND}",
+                    "platforms": str(platform_id),
+                    "ordering": ordering,
+                }
+                query = {key: value for key, value in search_params.items() if value is not None}
+                prebuilt_urls[(platform_id, ordering)] = str(httpx.URL(self.RAWG_GAMES_API_BASE_URL, params=query))
+        return prebuilt_urls
+
+    @classmethod
+    def _parse_search_results(cls, content: bytes) -> dict[str, Any]:
+        """Decode a RAWG search payload, keeping only the result fields the tools use."""
+
+        # orjson decodes a whole page faster than streaming it with ijson; the projection lets the
+        # unused nested fields be freed as soon as this returns.
+        search_results = orjson.loads(content).get("results") or []
+        return {
+            "results": [
+                {field: search_result.get(field) for field in cls.SEARCH_RESULT_FIELDS}
+                for search_result in search_results
+            ]
+        }
+
+    @staticmethod
+    def _normalize_search_text(text: str) -> str:
+        """Lowercase a search string and collapse its whitespace so equivalent searches share a cache key."""
+
+        # RAWG search ignores case and spacing; lower() rather than casefold() keeps characters
+        # such as "ß" intact in the query RAWG receives.
+        return " ".join(text.split()).lower()
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Return whether a failed request may succeed when retried."""
+
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+            return status_code == 429 or status_code >= 500
+        return isinstance(error, httpx.TransportError)
+
+    async def _make_request_with_retry(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        parse_response: Callable[[bytes], Any] | None = None,
     ) -> dict[str, Any]:
         """
-        Execute an HTTP GET request with exponential backoff retry logic for transient failures.
+        Execute an HTTP GET request with retries, serving repeats from cache and coalescing duplicates.
         
-        Uses exponential backoff with jitter to prevent overwhelming the API during outages
-        and to avoid thundering herd problems when multiple clients retry simultaneously.
+        The shared base parameters (API key, exclude_additions) are added here, so callers pass
+        only request-specific parameters. Successful responses are cached per URL and those
+        parameters; failures are never cached.
+        Concurrent identical requests share a single in-flight call instead of each hitting RAWG.
         
         Args:
             url: The URL to send the GET request to
-            params: Query parameters to include in the request
+            params: Request-specific query parameters, on top of the shared base parameters,
+                    or None when the URL already carries its complete query string
             max_retries: Maximum number of retry attempts (default: 3)
-            base_delay: Base delay in seconds for exponential backoff (default: 1.0)
-                       Actual delays will be: base_delay, base_delay*2, base_delay*4, etc.
+            base_delay: Minimum delay in seconds between retries (default: 1.0)
+            parse_response: Optional parser for the raw response body (default: full JSON decode)
         
         Returns:
             A dictionary with 'success' boolean and either 'results' or 'error' key
         """
+        # Serve repeated lookups from the response cache when possible.
+        cache_key = (url, tuple(sorted(params.items())) if params else ())
+        cached_response = self._cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response
+
+        # Wait on an identical request that is already in flight rather than sending another.
+        # Shielding keeps a cancelled waiter from cancelling the shared request for everyone else.
+        while (inflight_request := self._inflight.get(cache_key)) is not None:
+            try:
+                return await asyncio.shield(inflight_request)
+            except asyncio.CancelledError:
+                # Re-raise this caller's own cancellation. If only the owning request was cancelled,
+                # loop to join a newer in-flight request or send this one ourselves.
+                if not inflight_request.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        # Register this call as the in-flight request before the first await so duplicates find it.
+        inflight_request = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = inflight_request
+        try:
+            result = await self._send_request_with_retry(url, params, max_retries, base_delay, parse_response)
+        except asyncio.CancelledError:
+            # Waiters fall back to their own request instead of inheriting this cancellation.
+            inflight_request.cancel()
+            raise
+        except Exception as error:
+            inflight_request.set_exception(error)
+            # Mark the error retrieved so the loop does not report it when nobody was waiting.
+            inflight_request.exception()
+            raise
+        else:
+            if result["success"]:
+                self._cache[cache_key] = result
+            inflight_request.set_result(result)
+        finally:
+            self._inflight.pop(cache_key, None)
+
+        return result
+
+    async def _send_request_with_retry(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        max_retries: int,
+        base_delay: float,
+        parse_response: Callable[[bytes], Any] | None,
+    ) -> dict[str, Any]:
+        """
+        Send an HTTP GET request with capped, decorrelated-jitter backoff for transient failures.
+        
+        Each delay is drawn between base_delay and three times the previous delay, capped at
+        MAX_RETRY_DELAY_SECONDS, which spreads out retries from concurrent callers during outages.
+        Only connection errors, timeouts, rate limiting (429) and server errors (5xx) are retried;
+        other client errors such as 404 fail immediately.
+        """
         last_error = None
+        client = self._get_client()
         
+        # Drop unset values so they are left out of the query string entirely. A complete URL is
+        # sent as-is, since passing any params would make httpx re-encode its whole query string.
+        query = None if params is None else {
+            key: value
+            for key, value in (self._base_params | params).items()
+            if value is not None
+        }
+
         # Attempt the request up to max_retries times
+        delay = base_delay
         for attempt in range(max_retries):
             try:
-                # Execute the GET request with timeout settings
-                response = self.http_session.get(url, params=params, timeout=(3, 10))
+                # Execute the GET request using the client's timeout settings
+                response = await client.get(url, params=query)
                 response.raise_for_status()
-                return {"success": True, "results": response.json()}
-            except requests.RequestException as error:
+                payload = parse_response(response.content) if parse_response else response.json()
+                return {"success": True, "results": payload}
+            except (httpx.HTTPError, ValueError) as error:
                 last_error = error
+
+                # Client errors such as "game not found" will not change on retry.
+                if not self._is_retryable(error):
+                    logger.warning("Request failed with non-retryable error: %s", error)
+                    break
                 
                 # Log the retry attempt unless this is the final attempt
                 if attempt < max_retries - 1:
-                    # Calculate exponential backoff delay: base_delay * (2 ^ attempt)
-                    # Add jitter (random 0-100ms) to prevent thundering herd
-                    delay = base_delay * (2 ** attempt) + random.uniform(0, 0.1)
+                    # Decorrelated jitter: grow from the previous delay, capped to bound the wait
+                    delay = min(self.MAX_RETRY_DELAY_SECONDS, random.uniform(base_delay, delay * 3))
                     
-                    print(f"Request failed (attempt {attempt + 1}/{max_retries}): {error}")
-                    print(f"Retrying in {delay:.2f} seconds...")
-                    time.sleep(delay)
+                    logger.warning("Request failed (attempt %d/%d): %s", attempt + 1, max_retries, error)
+                    logger.debug("Retrying in %.2f seconds...", delay)
+                    await asyncio.sleep(delay)
                 else:
                     # Final attempt failed - log and return error
-                    print(f"Request failed after {max_retries} attempts: {error}")
+                    logger.warning("Request failed after %d attempts: %s", max_retries, error)
         
         # All retries exhausted - return the last error encountered
         return {"success": False, "error": str(last_error)}
@@ -90,39 +318,33 @@ class Database:
     #     Game Data
     # ====================
 
-    def get_game_details(self, game_id: int) -> dict[str, Any]:
+    async def get_game_details(self, game_id: int) -> dict[str, Any]:
         """Get the details of a game by its ID."""
 
-        # Prepare query parameters for the RAWG game details endpoint.
-        params = {
-            "key": self.rawg_api_key,
-            "exclude_additions": True,
-        }
-
+        # The details endpoint needs only the shared base parameters.
         # Execute the request with automatic retry logic
-        return self._make_request_with_retry(
+        return await self._make_request_with_retry(
             url=f"{self.RAWG_GAMES_API_BASE_URL}/{game_id}",
-            params=params
+            params={}
         )
 
 
-    def search_game_by_name(self, game_name: str) -> dict[str, Any]:
+    async def search_game_by_name(self, game_name: str) -> dict[str, Any]:
         """Search the RAWG catalogue for games matching the provided name."""
 
-        # Prepare query parameters for the RAWG search endpoint.
+        # Prepare query parameters for the RAWG search endpoint, normalized so spelling variants
+        # share one cache entry and one request.
         search_params = {
-            "key": self.rawg_api_key,
-            "search": game_name,
-            "exclude_additions": True,
+            "search": self._normalize_search_text(game_name),
         }
 
         # Execute the request with automatic retry logic
-        return self._make_request_with_retry(
+        return await self._make_request_with_retry(
             url=self.RAWG_GAMES_API_BASE_URL,
             params=search_params
         )
 
-    def find_multiple_games_by_conditions(
+    async def find_multiple_games_by_conditions(
         self,
         release_date_lower_bound: str,
         release_date_upper_bound: str,
@@ -139,51 +361,61 @@ class Database:
         tags: list[str] | None = None,
         ordering: str | None = None,
     ) -> dict[str, Any]:
+        # Serve the common single-platform shape from its prebuilt URL when nothing else is filtered.
+        if (
+            platform_ids
+            and len(platform_ids) == 1
+            and page_size == self.PREBUILT_PAGE_SIZE
+            and title is None
+            and release_date_lower_bound == self.DEFAULT_RELEASE_DATE_LOWER_BOUND
+            and release_date_upper_bound == self.DEFAULT_RELEASE_DATE_UPPER_BOUND
+            and metacritic_lower_bound == self.DEFAULT_METACRITIC_LOWER_BOUND
+            and metacritic_upper_bound == self.DEFAULT_METACRITIC_UPPER_BOUND
+            and not (parent_platform_ids or store_ids or developers or publishers or genres or tags)
+        ):
+            prebuilt_url = self._prebuilt_search_urls.get((platform_ids[0], ordering))
+            if prebuilt_url is not None:
+                return await self._make_request_with_retry(
+                    url=prebuilt_url,
+                    params=None,
+                    parse_response=self._parse_search_results,
+                )
+
         # Prepare query parameters for the RAWG search endpoint.
         search_params = {
-            "key": self.rawg_api_key,
             "page_size": page_size,
             "dates": f"{release_date_lower_bound},{release_date_upper_bound}",
             "metacritic": f"{metacritic_lower_bound},{metacritic_upper_bound}",
-            "exclude_additions": True,
         }
 
         if title is not None:
-            search_params["search"] = title
-
-        if parent_platform_ids:
-            search_params["parent_platforms"] = ",".join(str(id) for id in parent_platform_ids)
-
-        if platform_ids:
-            search_params["platforms"] = ",".join(str(id) for id in platform_ids)
-
-        if store_ids:
-            search_params["stores"] = ",".join(str(id) for id in store_ids)
-
-        if developers:
-            search_params["developers"] = ",".join(developers)
-
-        if publishers:
-            search_params["publishers"] = ",".join(publishers)
-
-        if genres:
-            search_params["genres"] = ",".join(genres)
-
-        if tags:
-            search_params["tags"] = ",".join(tags)
+            search_params["search"] = self._normalize_search_text(title)
+
+        # Join each provided list filter into RAWG's comma-separated form; IDs need stringifying.
+        optional_list_params = (
+            ("parent_platforms", parent_platform_ids, True),
+            ("platforms", platform_ids, True),
+            ("stores", store_ids, True),
+            ("developers", developers, False),
+            ("publishers", publishers, False),
+            ("genres", genres, False),
+            ("tags", tags, False),
+        )
+        for param_name, values, are_ints in optional_list_params:
+            if values:
+                search_params[param_name] = ",".join(map(str, values)) if are_ints else ",".join(values)
 
         if ordering is not None:
             search_params["ordering"] = ordering
 
         # Execute the request with automatic retry logic
-        result = self._make_request_with_retry(
+        result = await self._make_request_with_retry(
             url=self.RAWG_GAMES_API_BASE_URL,
-            params=search_params
+            params=search_params,
+            parse_response=self._parse_search_results,
         )
         return result
 
-        return result
-
 # Instantiate a shared database object for reuse across the application.
 DATABASE = Database()  # Shared singleton exposing configuration, authentication, and query helpers.
 
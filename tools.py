@@ -1,17 +1,14 @@
+from collections.abc import Mapping
 from typing import Any
 
-import datetime
+from dataclasses import asdict
 
 from classes import GameDetailsResponse, GameDescriptionResponse
 from constants import (
-    DEVELOPER_SLUGS,
-    GENRE_SLUGS,
-    ORDERINGS,
     PARENT_PLATFORM_SLUG_TO_ID,
     PLATFORM_SLUG_TO_ID,
-    PUBLISHER_SLUGS,
+    SCHEMA_ENUM_POOL,
     STORE_SLUG_TO_ID,
-    TAG_SLUGS,
 )
 from database import DATABASE
 
@@ -19,47 +16,26 @@ from database import DATABASE
 #    ID Conversions
 # ====================
 
+def _map_slugs(slugs: list[str], slug_to_id: Mapping[str, int]) -> list[int]:
+    """Translate slugs into RAWG IDs using the given mapping, dropping unknown entries."""
+    return [
+        slug_id
+        for slug in slugs
+        if isinstance(slug, str) and (slug_id := slug_to_id.get(slug)) is not None
+    ]
+
 def _get_platform_ids(slugs: list[str]) -> list[int]:
     """Convert platform slugs into RAWG platform IDs, excluding unknown entries."""
-
-    # Accumulate the translated platform IDs for the provided slugs.
-    platform_ids: list[int] = []
-
-    # Iterate through each slug to map it using the canonical dictionary.
-    for slug in slugs:
-        # Fetch the platform ID when the slug is recognized.
-        platform_id = PLATFORM_SLUG_TO_ID.get(slug)
-
-        # Append the ID only when it exists in the mapping.
-        if platform_id is not None:
-            platform_ids.append(platform_id)
-
-    return platform_ids
+    return _map_slugs(slugs, PLATFORM_SLUG_TO_ID)
 
 def _get_parent_platform_ids(slugs: list[str]) -> list[int]:
     """Convert parent platform slugs into RAWG parent platform IDs."""
-
-    parent_ids: list[int] = []
-
-    for slug in slugs:
-        parent_id = PARENT_PLATFORM_SLUG_TO_ID.get(slug)
-        if parent_id is not None:
-            parent_ids.append(parent_id)
-
-    return parent_ids
+    return _map_slugs(slugs, PARENT_PLATFORM_SLUG_TO_ID)
 
 
 def _get_store_ids(slugs: list[str]) -> list[int]:
     """Convert store slugs into RAWG store IDs, ignoring unknown entries."""
-
-    store_ids: list[int] = []
-
-    for slug in slugs:
-        store_id = STORE_SLUG_TO_ID.get(slug)
-        if store_id is not None:
-            store_ids.append(store_id)
-
-    return store_ids
+    return _map_slugs(slugs, STORE_SLUG_TO_ID)
 
 def _normalize_list_param(param: list[str] | str | None) -> list[str]:
     """Convert a parameter to a list, handling None, single items, and existing lists."""
@@ -69,23 +45,14 @@ def _normalize_list_param(param: list[str] | str | None) -> list[str]:
         return param
     return [param]
 
-# ====================
-#    Helpers Tools
-# ====================
-
-def get_current_date() -> str:
-    """Get the current date in the format YYYY-MM-DD."""
-    response = f"Today's date is {datetime.datetime.now().strftime('%Y-%m-%d')}"
-    return {"success": True, "results": response}
-
 # ====================
 #    Database Fetch
 # ====================
 
-def get_game_description(game_id: int) -> dict[str, Any]:
+async def get_game_description(game_id: int) -> dict[str, Any]:
     """Fetch the description of a game by its ID."""
     # Fetch the RAWG game detail payload for the provided ID.
-    db_response = DATABASE.get_game_details(game_id)
+    db_response = await DATABASE.get_game_details(game_id)
     rawg_payload = db_response.get("results")
 
     if not db_response.get("success") or not rawg_payload:
@@ -99,16 +66,16 @@ def get_game_description(game_id: int) -> dict[str, Any]:
     try:
         # Attempt to build the description response from the JSON payload.
         response_object = GameDescriptionResponse.create_description_response_from_json(rawg_payload)
-        # Convert the pydantic model into a plain dictionary so it is JSON serializable.
-        response_payload = response_object.model_dump()
+        # Convert the dataclass into a plain dictionary so it is JSON serializable.
+        response_payload = asdict(response_object)
         return {"success": True, "results": response_payload}
     except Exception as error:  # Broad except to handle unexpected payload issues.
         return {"success": False, "failure_reason": f"Parsing error: {error}"}
 
-def find_game_by_name(game_name: str) -> dict[str, Any]:
+async def find_game_by_name(game_name: str) -> dict[str, Any]:
     """Fetch detailed RAWG metadata for the requested game."""
     # Use the RAWG API to find the game by name.
-    db_response = DATABASE.search_game_by_name(game_name)
+    db_response = await DATABASE.search_game_by_name(game_name)
     rawg_payload = (db_response or {}).get("results", {}).get("results")
 
     if not db_response.get("success") or not rawg_payload:
@@ -119,23 +86,19 @@ def find_game_by_name(game_name: str) -> dict[str, Any]:
             "failure_reason": f"Database error: {error_message}",
         }
 
-    # Extract the list of search results from the RAWG payload.
+    # Serialize the first 3 search results as the primary matches.
+    serialized_games = GameDetailsResponse.create_serialized_games_from_search_results(rawg_payload[:3])
 
-    # Convert the FIRST few results into GameDetailsResponse objects.
-    game_objects = GameDetailsResponse.create_game_objects_from_search_results(rawg_payload)
-
-    if not game_objects:
+    if not serialized_games:
         # Notify the caller that no results could be parsed.
         return {
             "success": False,
             "failure_reason": "Failed to parse database results.",
         }
 
-    # Return the first 3 parsed GameDetailsResponses as the primary matches.
-    serialized_games = [game.model_dump() for game in game_objects[:3]]
     return {"success": True, "results": serialized_games}
 
-def find_multiple_games(
+async def find_multiple_games(
     num_results: int = 5,
     title: str | None = None,
     parent_platforms: list[str] | None = None,
@@ -163,7 +126,7 @@ def find_multiple_games(
     tags = _normalize_list_param(tags)
 
     # Invoke the database to retrieve the raw results.
-    db_response = DATABASE.find_multiple_games_by_conditions(
+    db_response = await DATABASE.find_multiple_games_by_conditions(
         page_size=num_results,
         title=title,
         parent_platform_ids=_get_parent_platform_ids(parent_platforms),
@@ -173,10 +136,14 @@ def find_multiple_games(
         publishers=publishers,
         genres=genres,
         tags=tags,
-        release_date_lower_bound=release_date_lower_bound or "1800-01-01",
-        release_date_upper_bound=release_date_upper_bound or "3000-01-01",
-        metacritic_lower_bound=metacritic_lower_bound if metacritic_lower_bound is not None else 0,
-        metacritic_upper_bound=metacritic_upper_bound if metacritic_upper_bound is not None else 100,
+        release_date_lower_bound=release_date_lower_bound or DATABASE.DEFAULT_RELEASE_DATE_LOWER_BOUND,
+        release_date_upper_bound=release_date_upper_bound or DATABASE.DEFAULT_RELEASE_DATE_UPPER_BOUND,
+        metacritic_lower_bound=(
+            metacritic_lower_bound if metacritic_lower_bound is not None else DATABASE.DEFAULT_METACRITIC_LOWER_BOUND
+        ),
+        metacritic_upper_bound=(
+            metacritic_upper_bound if metacritic_upper_bound is not None else DATABASE.DEFAULT_METACRITIC_UPPER_BOUND
+        ),
         ordering=ordering,
     )
     rawg_payload = (db_response or {}).get("results", {}).get("results")
@@ -189,31 +156,39 @@ def find_multiple_games(
         }
 
 
-    # Convert the FIRST few results into GameDetailsResponse objects.
-    game_objects = GameDetailsResponse.create_game_objects_from_search_results(rawg_payload)
+    # Serialize every search result straight into dictionaries shaped like GameDetailsResponse.
+    serialized_games = GameDetailsResponse.create_serialized_games_from_search_results(rawg_payload)
 
-    if not game_objects:
+    if not serialized_games:
         return {
             "success": False,
             "failure_reason": "Failed to parse database results.",
         }
 
-    # Return all parsed GameDetailsResponse objects as serializable dictionaries.
-    serialized_games = [game.model_dump() for game in game_objects]
     return {"success": True, "results": serialized_games}
 
 # =====================
 #   Tool Declarations
 # =====================
 
-VIDEO_GAME_TOOLS = [
-    {
-        "type": "function",
-        "function": {
-            "name": "get_current_date",
-            "description": "Get the current date in the format YYYY-MM-DD. Use this when you need to calculate date ranges for filtering games by relative dates (e.g., 'games from last year', 'games released in the past 6 months').",
-        },
-    },
+# Item schema shared by every string-array parameter instead of a fresh copy per parameter.
+_STRING_ITEMS = {"type": "string"}
+
+
+def _string_array(enum: tuple[str, ...], description: str) -> dict[str, Any]:
+    """Declare an array parameter whose items are restricted to the given slugs."""
+    return {"type": "array", "items": _STRING_ITEMS, "enum": enum, "description": description}
+
+
+# The only callables the model may invoke, keyed by the names declared in VIDEO_GAME_TOOLS.
+TOOL_REGISTRY = {
+    tool.__name__: tool
+    for tool in (find_game_by_name, find_multiple_games)
+}
+
+# Built once at import and shared by reference on every model call; a tuple so nothing can
+# append to or reorder the schema between requests.
+VIDEO_GAME_TOOLS = (
     {
         "type": "function",
         "function": {
@@ -249,48 +224,34 @@ VIDEO_GAME_TOOLS = [
                         "type": "string",
                         "description": "Filters results to games with a title that contain or closely matches this value.",
                     },
-                    "parent_platforms": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "enum": sorted(PARENT_PLATFORM_SLUG_TO_ID.keys()),
-                        "description": "Filters results to games that can be played on at least one of the provided parent platforms.",
-                    },
-                    "platforms": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "enum": sorted(PLATFORM_SLUG_TO_ID.keys()),
-                        "description": "Filters results to games that can be played on at least one of the provided platforms.",
-                    },
-                    "stores": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "enum": sorted(STORE_SLUG_TO_ID.keys()),
-                        "description": "Filters results to games that are available for purchase from at least one of the provided stores.",
-                    },
-                    "developers": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "enum": DEVELOPER_SLUGS,
-                        "description": "Filters results to games that were developed by at least one of the provided developers.",
-                    },
-                    "publishers": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "enum": PUBLISHER_SLUGS,
-                        "description": "Filters results to games that were published by at least one of the provided publishers.",
-                    },
-                    "genres": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "enum": GENRE_SLUGS,
-                        "description": "Filters results to games that fall into at least one of the provided genres.",
-                    },
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "enum": TAG_SLUGS,
-                        "description": "Filters results to games that contain at least one of the provided tags.",
-                    },
+                    "parent_platforms": _string_array(
+                        enum=SCHEMA_ENUM_POOL["parent_platforms"],
+                        description="Filters results to games that can be played on at least one of the provided parent platforms.",
+                    ),
+                    "platforms": _string_array(
+                        enum=SCHEMA_ENUM_POOL["platforms"],
+                        description="Filters results to games that can be played on at least one of the provided platforms.",
+                    ),
+                    "stores": _string_array(
+                        enum=SCHEMA_ENUM_POOL["stores"],
+                        description="Filters results to games that are available for purchase from at least one of the provided stores.",
+                    ),
+                    "developers": _string_array(
+                        enum=SCHEMA_ENUM_POOL["developers"],
+                        description="Filters results to games that were developed by at least one of the provided developers.",
+                    ),
+                    "publishers": _string_array(
+                        enum=SCHEMA_ENUM_POOL["publishers"],
+                        description="Filters results to games that were published by at least one of the provided publishers.",
+                    ),
+                    "genres": _string_array(
+                        enum=SCHEMA_ENUM_POOL["genres"],
+                        description="Filters results to games that fall into at least one of the provided genres.",
+                    ),
+                    "tags": _string_array(
+                        enum=SCHEMA_ENUM_POOL["tags"],
+                        description="Filters results to games that contain at least one of the provided tags.",
+                    ),
                     "release_date_lower_bound": {
                         "type": "string",
                         "format": "date",
@@ -315,11 +276,11 @@ VIDEO_GAME_TOOLS = [
                     },
                     "ordering": {
                         "type": "string",
-                        "enum": ORDERINGS,
+                        "enum": SCHEMA_ENUM_POOL["ordering"],
                         "description": "What attribute to sort the resulting list of games by. Values prefixed with '-' are sorted in descending order. Otherwise it is ascending order.",
                     },
                 },
             },
         },
     },
-]
\ No newline at end of file
+)